@@ -18,7 +18,7 @@ def create_video_analyzer(tools=None):
     Returns:
         Agent: Configured CrewAI agent
     """
-    logger.info('Creating Video Content Analyzer agent.')
+    logger.debug('Creating Video Content Analyzer agent.')
     return Agent(
         role='Video Content Analyzer',
         goal='Extract key insights, main points, and engaging content from YouTube videos',
@@ -42,7 +42,7 @@ def create_content_creator(tools=None):
     Returns:
         Agent: Configured CrewAI agent
     """
-    logger.info('Creating Creative Content Writer agent.')
+    logger.debug('Creating Creative Content Writer agent.')
     return Agent(
         role='Creative Content Writer',
         goal='Transform video insights into engaging, platform-optimized content',
@@ -66,7 +66,7 @@ def create_platform_specialist(tools=None):
     Returns:
         Agent: Configured CrewAI agent
     """
-    logger.info('Creating Platform Optimization Specialist agent.')
+    logger.debug('Creating Platform Optimization Specialist agent.')
     return Agent(
         role='Platform Optimization Specialist',
         goal='Optimize content specifically for Instagram or Medium based on platform best practices',
@@ -1,36 +1,68 @@
 # logger.py - Logging Setup
 # ------------------------
 # This module provides a standard logging setup for the modular app.
-# Logs are written to both a rotating file and the console.
+# Logs are written to both a rotating file (JSON lines) and the console.
+# Records are handed off through a queue so the Streamlit thread never blocks on disk I/O.
 # Logging is initialized at app startup.
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import os
+import queue
+import orjson
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects using orjson."""
+    def format(self, record):
+        # QueueHandler has already merged any traceback into the message
+        entry = {
+            't': record.created,
+            'lvl': record.levelname,
+            'name': record.name,
+            'msg': record.getMessage(),
+        }
+        return orjson.dumps(entry).decode()
 
 def setup_logging(log_dir='logs', log_file='app.log'):
     """
     Set up logging for the app.
-    Logs go to both a rotating file and the console.
+    Logs go to both a rotating file and the console, written by a background
+    QueueListener thread. Safe to call on every Streamlit rerun.
+    The level comes from the LOG_LEVEL environment variable (default INFO);
+    set LOG_LEVEL=WARNING in production to drop per-request INFO records.
     Args:
         log_dir (str): Directory for log files
         log_file (str): Log file name
     """
+    logger = logging.getLogger()
+    # Streamlit re-executes the script on every rerun; only install the queue once
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        return
     os.makedirs(log_dir, exist_ok=True)
     log_path = os.path.join(log_dir, log_file)
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
+    level_name = os.getenv('LOG_LEVEL', 'INFO').upper()
+    level = logging.getLevelName(level_name)
+    # getLevelName returns a 'Level X' string for names that are not log levels
+    valid_level = isinstance(level, int)
+    logger.setLevel(level if valid_level else logging.INFO)
 
     # File handler (rotating): keeps up to 5 files, 2MB each
     file_handler = RotatingFileHandler(log_path, maxBytes=2*1024*1024, backupCount=5)
-    file_formatter = logging.Formatter('[%(asctime)s] %(levelname)s %(name)s: %(message)s')
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(JsonFormatter())
 
     # Console handler: outputs to terminal/Streamlit logs
     console_handler = logging.StreamHandler()
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
-    logger.info('Logging is set up. Logs will be written to %s', log_path) 
\ No newline at end of file
+    # Root logger only enqueues records; the listener thread does the actual writes
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    if not valid_level:
+        logger.warning('Invalid LOG_LEVEL %r; using INFO', level_name)
+    logger.info('Logging is set up. Logs will be written to %s', log_path)
@@ -8,25 +8,25 @@ import streamlit as st
 import os
 from dotenv import load_dotenv
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import queue
 
 # Import the logging setup function
 from logger import setup_logging
-# Import the YouTube video analyzer
-from youtube_tools import YouTubeVideoAnalyzer
-# Import agent creation functions
-from agents import create_video_analyzer, create_content_creator, create_platform_specialist
-# Import task creation function
-from tasks import create_tasks
-from crewai import Crew, Process
+# Import the YouTube URL validator and the cached static asset loader
+from ui import validate_youtube_url, load_asset
+# The YouTube analyzer, agents, tasks and crewai pull in yt_dlp and crewai (langchain,
+# chromadb, ...); they are imported inside the Generate Content branch so that page
+# renders which never generate content do not pay for loading them.
 
-# 1. Initialize logging (file + console)
+# 1. Load environment variables from .env (for API keys, LOG_LEVEL, etc.)
+load_dotenv()
+
+# 2. Initialize logging (file + console)
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# 2. Load environment variables from .env (for API keys, etc.)
-load_dotenv()
-
 # 3. Streamlit UI configuration
 st.set_page_config(
     page_title="YouTube to Content Creator",
@@ -36,38 +36,10 @@ st.set_page_config(
 )
 
 # 4. Inject custom CSS for dark mode and card styling
-st.markdown("""
-<style>
-body, .main, .stApp {
-    background: #181a20 !important;
-    color: #f8f9fa !important;
-}
-.main-header {
-    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    padding: 2rem;
-    border-radius: 10px;
-    color: white;
-    text-align: center;
-    margin-bottom: 2rem;
-}
-.feature-card {
-    background: #23272f;
-    color: #f8f9fa;
-    padding: 1.5rem;
-    border-radius: 10px;
-    border-left: 4px solid #667eea;
-    margin: 1rem 0;
-}
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{load_asset('styles.css')}</style>", unsafe_allow_html=True)
 
 # 5. App header
-st.markdown("""
-<div class="main-header">
-    <h1>🎬 YouTube to Content Creator</h1>
-    <p>Transform YouTube videos into Instagram/Medium content using AI agents</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(load_asset('header.html'), unsafe_allow_html=True)
 
 # 6. Sidebar for API key input
 with st.sidebar:
@@ -94,18 +66,6 @@ with col1:
         placeholder="https://www.youtube.com/watch?v=...",
         help="Paste the full YouTube video URL you want to convert"
     )
-    # Helper function to validate YouTube URLs
-    def validate_youtube_url(url):
-        import re
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+'
-        ]
-        for pattern in youtube_patterns:
-            if re.match(pattern, url):
-                return True
-        return False
     # Validate the URL and show error if invalid
     if video_url and not validate_youtube_url(video_url):
         st.error("❌ Please enter a valid YouTube URL")
@@ -138,79 +98,89 @@ with col1:
         os.environ["OPENAI_API_KEY"] = openai_api_key
         os.environ["OPENAI_MODEL_NAME"] = "gpt-4-0125-preview"
         with st.spinner("🤖 AI agents are working on your content..."):
-            # 1. Analyze the YouTube video (extract transcript, description, etc.)
+            # Heavy imports, loaded on first use (cached in sys.modules afterwards)
+            from youtube_tools import YouTubeVideoAnalyzer
+            from agents import create_video_analyzer, create_content_creator, create_platform_specialist
+            from tasks import create_tasks
+            from crewai import Crew, Process
+            # 1-2. Analyze the YouTube video (network-bound) while the three agents are
+            # created concurrently, so agent setup is hidden behind the download
             analyzer = YouTubeVideoAnalyzer()
-            video_info = analyzer.analyze_video(video_url)
-            logger.info(f"Video info: {video_info}")
-            # 2. Create the three agents
-            video_analyzer = create_video_analyzer()
-            content_creator = create_content_creator()
-            platform_specialist = create_platform_specialist()
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                info_future = executor.submit(analyzer.analyze_video, video_url)
+                agent_futures = [
+                    executor.submit(create)
+                    for create in (create_video_analyzer, create_content_creator, create_platform_specialist)
+                ]
+                video_info = info_future.result()
+                video_analyzer, content_creator, platform_specialist = (f.result() for f in agent_futures)
+            if "error" in video_info:
+                st.error(f"❌ {video_info['error']}")
+                st.stop()
+            # video_info carries the whole transcript; skip building the record unless INFO is on
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Video info: %s', video_info)
             # 3. Create the tasks (with transcript/description embedded)
+            # Each finished task pushes its output here so progress can be shown live
+            task_outputs = queue.Queue()
             tasks = create_tasks(
                 video_url, platform, content_type, video_info,
-                video_analyzer, content_creator, platform_specialist
+                video_analyzer, content_creator, platform_specialist,
+                callback=task_outputs.put
             )
             # 4. Create the Crew and run the workflow
+            # Each run is a one-shot request with nothing to recall later, so crew memory
+            # (embedding calls + local store writes on every step) and telemetry sharing
+            # are off; only the tool cache is kept.
             crew = Crew(
                 agents=[video_analyzer, content_creator, platform_specialist],
                 tasks=tasks,
                 process=Process.sequential,
-                memory=True,
+                memory=False,
                 cache=True,
                 max_rpm=100,
-                share_crew=True
+                share_crew=False,
+                embedder=None
             )
             try:
-                # Run the CrewAI workflow
-                result = crew.kickoff()
+                # Run the CrewAI workflow in a worker thread; Streamlit calls must stay on
+                # this thread, so intermediate task outputs are drained from the queue here
+                progress = st.empty()
+                partial_outputs = []
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    kickoff_future = executor.submit(crew.kickoff)
+                    while True:
+                        try:
+                            output = task_outputs.get(timeout=0.5)
+                        except queue.Empty:
+                            if kickoff_future.done():
+                                break
+                            continue
+                        partial_outputs.append(str(output))
+                        progress.markdown("\n\n---\n\n".join(partial_outputs))
+                    result = kickoff_future.result()
+                progress.empty()
+                # Serialize the crew output once and reuse it for display and download
+                content = str(result)
                 st.success("✅ Content generated successfully!")
                 st.header("📝 Generated Content")
                 st.markdown("---")
-                st.markdown(str(result))
+                st.markdown(content)
                 # Download button for the generated content
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"{platform.lower()}_{content_type.lower()}_{timestamp}.md"
                 st.download_button(
                     label="📥 Download Content",
-                    data=str(result),
+                    data=content.encode('utf-8'),
                     file_name=filename,
                     mime="text/markdown",
                     use_container_width=True
                 )
             except Exception as e:
-                logger.error(f"Error generating content: {e}")
+                logger.error('Error generating content: %s', e)
                 st.error(f"Error generating content: {e}")
 
 # 8. Tips and best practices in the right column
 with col2:
     st.header("💡 Tips")
-    st.markdown("""
-    <div class="feature-card">
-        <h4>🎯 Best Practices</h4>
-        <ul>
-            <li>Use high-quality YouTube videos</li>
-            <li>Videos with clear audio work best</li>
-            <li>Longer videos provide more content</li>
-            <li>Educational content performs well</li>
-        </ul>
-    </div>
-    <div class="feature-card">
-        <h4>⚡ Quick Tips</h4>
-        <ul>
-            <li>Instagram: Use relevant hashtags</li>
-            <li>Medium: Focus on storytelling</li>
-            <li>Add call-to-actions</li>
-            <li>Engage with your audience</li>
-        </ul>
-    </div>
-    <div class="feature-card">
-        <h4>📱 Instagram Tips</h4>
-        <ul>
-            <li>Use 5-15 hashtags</li>
-            <li>Keep captions engaging</li>
-            <li>Add emojis for visual appeal</li>
-            <li>Include call-to-actions</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    st.markdown(load_asset('tips.html'), unsafe_allow_html=True) 
\ No newline at end of file
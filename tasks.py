@@ -1,7 +1,8 @@
 # tasks.py - CrewAI Task Creation
 # ------------------------------
 # This module provides a function to create CrewAI tasks for the modular app.
-# Each task embeds the transcript and description for context.
+# Only the analysis task embeds the transcript and description; later tasks
+# receive it through CrewAI task context.
 # Logging is used for traceability.
 
 import logging
@@ -9,24 +10,46 @@ from crewai import Task
 
 logger = logging.getLogger(__name__)
 
-def create_tasks(video_url, platform, content_type, video_info, video_analyzer, content_creator, platform_specialist):
+# Upper bound on transcript characters embedded in prompts (~3k tokens)
+MAX_TRANSCRIPT_CHARS = 12000
+
+def _compress_transcript(text, max_chars=MAX_TRANSCRIPT_CHARS):
+    """
+    Cap the transcript length by keeping its head and tail.
+    The opening and closing of a video usually carry the topic and conclusions.
+    Args:
+        text (str): Full transcript
+        max_chars (int): Maximum number of characters to keep
+    Returns:
+        str: The transcript, trimmed from the middle if it exceeds max_chars
+    """
+    if len(text) <= max_chars:
+        return text
+    marker = "\n[... transcript truncated ...]\n"
+    head = (max_chars - len(marker)) * 2 // 3
+    tail = max_chars - len(marker) - head
+    return text[:head] + marker + text[-tail:]
+
+def create_tasks(video_url, platform, content_type, video_info, video_analyzer, content_creator, platform_specialist, callback=None):
     """
     Create the sequence of CrewAI tasks for the content creation workflow.
-    Each task embeds the transcript and description for the agents to use.
+    The transcript and description are embedded once, in the analysis task;
+    the later tasks build on its output via task context.
     Args:
         video_url (str): The YouTube video URL
         platform (str): Target platform (Instagram or Medium)
         content_type (str): Type of content to create
         video_info (dict): Extracted video metadata and transcript
         video_analyzer, content_creator, platform_specialist: CrewAI agents
+        callback (callable): Called with each task's output as it completes (optional)
     Returns:
         list: List of Task objects (analysis, creation, optimization)
     """
-    transcript = video_info.get('transcript', 'No transcript available')
+    transcript = _compress_transcript(video_info.get('transcript', 'No transcript available'))
     description = video_info.get('description', 'No description available')
     title = video_info.get('title', 'Unknown')
     duration = video_info.get('duration', 0)
-    logger.info(f'Creating tasks for video: {title}')
+    logger.info('Creating tasks for video: %s', title)
     # Task 1: Analysis - Agent analyzes the transcript and description
     analyze_task = Task(
         description=(
@@ -41,25 +64,26 @@ def create_tasks(video_url, platform, content_type, video_info, video_analyzer,
             "A comprehensive analysis of the specific video including: main topic, 5-7 key points, "
             "interesting facts, compelling quotes, and audience insights from this video only."
         ),
-        agent=video_analyzer
+        agent=video_analyzer,
+        callback=callback
     )
-    # Task 2: Content Creation - Agent creates content using the analysis and transcript
+    # Task 2: Content Creation - Agent creates content from the analysis (passed via context)
     create_task = Task(
         description=(
             f"Based on the analysis, create engaging content for {platform}. "
             f"The content should be optimized for {content_type} format. "
             "Make it compelling, informative, and shareable. "
             "Include relevant hashtags and call-to-actions where appropriate.\n"
-            f"REFERENCE: Transcript below:\n{transcript}\n"
-            f"REFERENCE: Description: {description}\n"
-            "IMPORTANT: Use ONLY the transcript and description above."
+            "Use the video analysis provided in context.\n"
+            "IMPORTANT: Use ONLY the video analysis provided; do NOT use general knowledge."
         ),
         expected_output=(
             f"A well-crafted {content_type} piece that captures the essence "
             "of the video while being optimized for the target platform."
         ),
         agent=content_creator,
-        context=[analyze_task]
+        context=[analyze_task],
+        callback=callback
     )
     # Task 3: Platform Optimization - Agent optimizes content for the chosen platform
     optimize_task = Task(
@@ -67,16 +91,16 @@ def create_tasks(video_url, platform, content_type, video_info, video_analyzer,
             f"Take the created content and optimize it specifically for {platform} {content_type}. "
             f"Apply platform-specific best practices, formatting, hashtag strategies, "
             f"and engagement techniques. Ensure it follows {platform} guidelines and trends.\n"
-            f"REFERENCE: Transcript below:\n{transcript}\n"
-            f"REFERENCE: Description: {description}\n"
-            "IMPORTANT: Use ONLY the transcript and description above."
+            "Use the video analysis provided in context.\n"
+            "IMPORTANT: Use ONLY the video analysis and created content provided; do NOT use general knowledge."
         ),
         expected_output=(
             f"Final optimized content ready for {platform} {content_type} with "
             "proper formatting, hashtags, and platform-specific optimizations."
         ),
         agent=platform_specialist,
-        context=[create_task]
+        context=[analyze_task, create_task],
+        callback=callback
     )
     logger.info('Tasks created successfully.')
     return [analyze_task, create_task, optimize_task] 
\ No newline at end of file
@@ -3,8 +3,30 @@
 # This module provides all Streamlit UI rendering functions for the modular app.
 # It separates UI logic from the main workflow logic for clarity and maintainability.
 
+import re
 import streamlit as st
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+# Accepted YouTube URL forms: watch?v=, embed/ and youtu.be/ followed by an
+# 11-character video ID, matching youtube_tools._ID_RE (compiled once per process)
+_YT_RE = re.compile(r'(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)[\w-]{11}(?![\w-])')
+
+def validate_youtube_url(url):
+    """Return True if the URL looks like a YouTube video URL."""
+    return bool(_YT_RE.match(url))
+
+@lru_cache(maxsize=None)
+def load_asset(name):
+    """
+    Read a static file from the assets directory, cached for the process lifetime.
+    Args:
+        name (str): File name inside assets/
+    Returns:
+        str: File contents
+    """
+    return (Path(__file__).parent / 'assets' / name).read_text(encoding='utf-8')
 
 def render_page_config():
     """Set Streamlit page configuration and inject custom CSS."""
@@ -14,39 +36,11 @@ def render_page_config():
         layout="wide",
         initial_sidebar_state="expanded"
     )
-    st.markdown("""
-    <style>
-    body, .main, .stApp {
-        background: #181a20 !important;
-        color: #f8f9fa !important;
-    }
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .feature-card {
-        background: #23272f;
-        color: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        margin: 1rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_asset('styles.css')}</style>", unsafe_allow_html=True)
 
 def render_header():
     """Render the app header."""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🎬 YouTube to Content Creator</h1>
-        <p>Transform YouTube videos into Instagram/Medium content using AI agents</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(load_asset('header.html'), unsafe_allow_html=True)
 
 def render_sidebar():
     """Render the sidebar for API key input. Returns the OpenAI API key."""
@@ -71,17 +65,6 @@ def render_input_form():
         placeholder="https://www.youtube.com/watch?v=...",
         help="Paste the full YouTube video URL you want to convert"
     )
-    def validate_youtube_url(url):
-        import re
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+'
-        ]
-        for pattern in youtube_patterns:
-            if re.match(pattern, url):
-                return True
-        return False
     if video_url and not validate_youtube_url(video_url):
         st.error("❌ Please enter a valid YouTube URL")
         st.stop()
@@ -110,12 +93,14 @@ def render_output(result, platform, content_type):
     st.success("✅ Content generated successfully!")
     st.header("📝 Generated Content")
     st.markdown("---")
-    st.markdown(str(result))
+    # Serialize the crew output once and reuse it for display and download
+    content = str(result)
+    st.markdown(content)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{platform.lower()}_{content_type.lower()}_{timestamp}.md"
     st.download_button(
         label="📥 Download Content",
-        data=str(result),
+        data=content.encode('utf-8'),
         file_name=filename,
         mime="text/markdown",
         use_container_width=True
@@ -124,32 +109,4 @@ def render_output(result, platform, content_type):
 def render_tips():
     """Render the tips and best practices section."""
     st.header("💡 Tips")
-    st.markdown("""
-    <div class="feature-card">
-        <h4>🎯 Best Practices</h4>
-        <ul>
-            <li>Use high-quality YouTube videos</li>
-            <li>Videos with clear audio work best</li>
-            <li>Longer videos provide more content</li>
-            <li>Educational content performs well</li>
-        </ul>
-    </div>
-    <div class="feature-card">
-        <h4>⚡ Quick Tips</h4>
-        <ul>
-            <li>Instagram: Use relevant hashtags</li>
-            <li>Medium: Focus on storytelling</li>
-            <li>Add call-to-actions</li>
-            <li>Engage with your audience</li>
-        </ul>
-    </div>
-    <div class="feature-card">
-        <h4>📱 Instagram Tips</h4>
-        <ul>
-            <li>Use 5-15 hashtags</li>
-            <li>Keep captions engaging</li>
-            <li>Add emojis for visual appeal</li>
-            <li>Include call-to-actions</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    st.markdown(load_asset('tips.html'), unsafe_allow_html=True) 
\ No newline at end of file
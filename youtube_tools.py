@@ -4,13 +4,181 @@
 # video metadata and transcript from a YouTube URL using yt_dlp.
 # Logging is used for traceability and debugging.
 
+import io
+import re
+import streamlit as st
 import yt_dlp
 import requests
-from urllib.parse import urlparse, parse_qs
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bound on each transcript download so a stalled server cannot hang the app
+_TRANSCRIPT_TIMEOUT = 10
+
+# Shared HTTP session: keeps connections alive across transcript downloads and runs
+_SESSION = requests.Session()
+_SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=10, max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# Video ID from a v= query parameter, youtu.be/ or embed/; IDs are exactly 11 characters
+_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|embed/)([\w-]{11})(?![\w-])')
+
+# VTT/SRT lines that carry no spoken text: header, cue numbers, timestamps, blanks
+_VTT_JUNK = re.compile(r'WEBVTT.*|[\d.:]+|.*-->.*|[ \t]*')
+# Runs of identical consecutive lines (auto-captions repeat each line across cues)
+_REPEATED_LINES = re.compile(r'(?m)^(.+)(?:\n\1)+$')
+
+def _vtt_keep(line):
+    """Return True if a VTT/SRT line carries spoken text."""
+    return not _VTT_JUNK.fullmatch(line)
+
+# Video metadata and transcripts rarely change; reuse them for an hour
+_CACHE_TTL = 3600
+
+class _UncachedResult(Exception):
+    """Carries an error result out of fetch_video_info so it is not cached."""
+    def __init__(self, result):
+        super().__init__(result.get("error"))
+        self.result = result
+
+def _extract_video_info(video_id):
+    """
+    Run yt_dlp and download the transcript for a video (uncached).
+    Args:
+        video_id (str): The YouTube video ID
+    Returns:
+        dict: Video information including title, description, transcript, and metadata
+    """
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+    # yt_dlp options to get subtitles and metadata without downloading video
+    ydl_opts = {
+        'writesubtitles': True,
+        'writeautomaticsub': True,
+        'subtitleslangs': ['en'],
+        'skip_download': True,
+        'quiet': True,
+        'outtmpl': '%(id)s',
+        # Only metadata and one caption track are needed: skip format manifests
+        'youtube_include_dash_manifest': False,
+        'youtube_include_hls_manifest': False,
+        'extractor_args': {'youtube': {'skip': ['dash', 'hls']}},
+        'socket_timeout': 10,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(video_url, download=False)
+    if info is None:
+        logger.error(f"Could not extract video information for: {video_url}")
+        return {"error": "Could not extract video information"}
+    # Extract metadata
+    title = info.get('title', 'Unknown Title')
+    description = info.get('description', '')
+    duration = info.get('duration', 0)
+    transcript = ""
+    try:
+        # Candidate transcript URLs: manual subtitles first, then automatic captions
+        subtitles = info.get('subtitles', {})
+        auto_subs = info.get('automatic_captions', {})
+        if not subtitles and not auto_subs:
+            logger.warning(f"No subtitles or automatic captions returned for {video_url}; falling back to description")
+        candidate_urls = [
+            url for url in (_vtt_url(subtitles), _vtt_url(auto_subs)) if url
+        ]
+        if candidate_urls:
+            text = _fetch_first_transcript(candidate_urls)
+            if text:
+                # Cue metadata is already filtered; collapse repeated caption lines
+                transcript = _REPEATED_LINES.sub(r'\1', text).strip()
+        # Fallback to description if no transcript
+        if not transcript:
+            transcript = description[:1000] if description else "No transcript available"
+    except Exception as e:
+        logger.warning(f"Transcript extraction failed: {e}")
+        transcript = description[:1000] if description else "No transcript available"
+    video_info = {
+        "video_id": video_id,
+        "title": title,
+        "description": description[:500] if description else "No description available",
+        "duration": duration,
+        "transcript": transcript,
+    }
+    logger.info(f"Extracted video info for {video_url}: {title}")
+    return video_info
+
+def _fetch_first_transcript(candidate_urls):
+    """
+    Download caption tracks in order of preference, stopping at the first success.
+    Later tracks (usually the larger auto-captions) are only fetched as a fallback.
+    Each body is streamed and filtered line by line as it arrives.
+    Args:
+        candidate_urls (list): Transcript URLs in order of preference
+    Returns:
+        str: Spoken-text lines of the first successful download, or None
+    """
+    for url in candidate_urls:
+        try:
+            result = _download_transcript(url)
+        except Exception as e:
+            logger.warning(f"Transcript download failed for {url}: {e}")
+            continue
+        if result:
+            return result
+    return None
+
+def _vtt_url(tracks):
+    """
+    Pick the English VTT caption URL from a yt_dlp subtitles mapping.
+    yt_dlp lists json3/srv formats before vtt, so the first entry is not VTT.
+    Args:
+        tracks (dict): Language code to list of caption formats
+    Returns:
+        str: VTT caption URL, or None if there is none
+    """
+    for track in (tracks or {}).get('en', []):
+        if track.get('ext') == 'vtt' and track.get('url'):
+            return track['url']
+    return None
+
+def _download_transcript(url):
+    """
+    Stream one caption track over the shared session, keeping spoken-text lines.
+    Args:
+        url (str): Transcript URL
+    Returns:
+        str: Filtered transcript text, or None if the request failed
+    """
+    with _SESSION.get(url, stream=True, timeout=_TRANSCRIPT_TIMEOUT) as resp:
+        if resp.status_code != 200:
+            return None
+        # WebVTT is UTF-8 by spec; requests would otherwise assume ISO-8859-1 for text/*
+        if 'charset' not in resp.headers.get('Content-Type', ''):
+            resp.encoding = 'utf-8'
+        buf = io.StringIO()
+        for line in resp.iter_lines(decode_unicode=True):
+            if _vtt_keep(line):
+                buf.write(line)
+                buf.write('\n')
+        return buf.getvalue()
+
+@st.cache_data(ttl=_CACHE_TTL, show_spinner=False)
+def fetch_video_info(video_id):
+    """
+    Fetch metadata and transcript for a video, memoized per video ID.
+    Keying on the ID lets URL variants (e.g. ?t=30s, youtu.be links) share one entry.
+    Args:
+        video_id (str): The YouTube video ID
+    Returns:
+        dict: Video information including title, description, transcript, and metadata
+    """
+    video_info = _extract_video_info(video_id)
+    if "error" in video_info:
+        raise _UncachedResult(video_info)
+    return video_info
+
 class YouTubeVideoAnalyzer:
     """
     Tool to analyze specific YouTube videos and extract their content.
@@ -27,69 +195,20 @@ class YouTubeVideoAnalyzer:
         Returns:
             dict: Video information including title, description, transcript, and metadata
         """
+        video_id = self._extract_video_id(video_url)
+        if not video_id:
+            logger.error(f"Could not extract video ID from URL: {video_url}")
+            return {"error": "Could not extract video ID from URL"}
         try:
-            # Extract the video ID from the URL
-            video_id = self._extract_video_id(video_url)
-            if not video_id:
-                logger.error(f"Could not extract video ID from URL: {video_url}")
-                return {"error": "Could not extract video ID from URL"}
-            # yt_dlp options to get subtitles and metadata without downloading video
-            ydl_opts = {
-                'writesubtitles': True,
-                'writeautomaticsub': True,
-                'subtitleslangs': ['en'],
-                'skip_download': True,
-                'quiet': True,
-                'outtmpl': '%(id)s',
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
-                if info is None:
-                    logger.error(f"Could not extract video information for: {video_url}")
-                    return {"error": "Could not extract video information"}
-                # Extract metadata
-                title = info.get('title', 'Unknown Title')
-                description = info.get('description', '')
-                duration = info.get('duration', 0)
-                transcript = ""
-                try:
-                    # Try to get transcript from subtitles or automatic captions
-                    subtitles = info.get('subtitles', {})
-                    auto_subs = info.get('automatic_captions', {})
-                    transcript_url = None
-                    if subtitles and 'en' in subtitles:
-                        transcript_url = subtitles['en'][0].get('url')
-                    elif auto_subs and 'en' in auto_subs:
-                        transcript_url = auto_subs['en'][0].get('url')
-                    if transcript_url:
-                        # Download and parse the transcript (VTT/SRT)
-                        resp = requests.get(transcript_url)
-                        if resp.status_code == 200:
-                            text = resp.text
-                            # Simple VTT/SRT to plain text conversion
-                            transcript = '\n'.join([
-                                line for line in text.splitlines()
-                                if line and not line.replace('.', '').replace(':', '').isdigit() and '-->' not in line and not line.startswith('WEBVTT')
-                            ]).strip()
-                    # Fallback to description if no transcript
-                    if not transcript:
-                        transcript = description[:1000] if description else "No transcript available"
-                except Exception as e:
-                    logger.warning(f"Transcript extraction failed: {e}")
-                    transcript = description[:1000] if description else "No transcript available"
-                video_info = {
-                    "video_id": video_id,
-                    "url": video_url,
-                    "title": title,
-                    "description": description[:500] if description else "No description available",
-                    "duration": duration,
-                    "transcript": transcript,
-                }
-                logger.info(f"Extracted video info for {video_url}: {title}")
-                return video_info
+            video_info = fetch_video_info(video_id)
+        except _UncachedResult as e:
+            return e.result
         except Exception as e:
             logger.error(f"Error analyzing video: {e}")
             return {"error": f"Error analyzing video: {str(e)}"}
+        # st.cache_data hands back a copy, so it is safe to record the caller's URL
+        video_info["url"] = video_url
+        return video_info
 
     def _extract_video_id(self, url):
         """
@@ -100,17 +219,5 @@ class YouTubeVideoAnalyzer:
         Returns:
             str: Video ID or None if not found
         """
-        try:
-            if 'youtube.com/watch' in url:
-                parsed_url = urlparse(url)
-                query_params = parse_qs(parsed_url.query)
-                return query_params.get('v', [None])[0]
-            elif 'youtu.be/' in url:
-                return url.split('youtu.be/')[-1].split('?')[0]
-            elif 'youtube.com/embed/' in url:
-                return url.split('youtube.com/embed/')[-1].split('?')[0]
-            else:
-                return None
-        except Exception as e:
-            logger.warning(f"Failed to extract video ID: {e}")
-            return None 
\ No newline at end of file
+        match = _ID_RE.search(url)
+        return match.group(1) if match else None